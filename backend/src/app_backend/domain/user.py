@@ -2,13 +2,14 @@
 Domain Model - Pure business logic tanpa dependency database
 Model domain murni yang berisi business logic
 """
+import inspect
 import uuid
 from datetime import datetime
 from typing import Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """Pure domain model untuk User - berisi business logic"""
     
@@ -16,7 +17,8 @@ class User:
     email: str
     username: str
     full_name: str
-    hashed_password: str
+    # None jika User dibuat dari projection tanpa kolom password
+    hashed_password: Optional[str]
     is_active: bool = True
     is_verified: bool = False
     created_at: datetime = field(default_factory=datetime.now)
@@ -33,6 +35,40 @@ class User:
         if not self.full_name:
             raise ValueError("Nama lengkap wajib diisi")
     
+    @classmethod
+    def from_trusted(
+        cls,
+        *,
+        id: uuid.UUID,
+        email: str,
+        username: str,
+        full_name: str,
+        hashed_password: Optional[str],
+        is_active: bool,
+        is_verified: bool,
+        created_at: datetime,
+        updated_at: datetime,
+    ) -> "User":
+        """
+        Buat User dari data yang sudah tervalidasi (mis. hasil baca database)
+        
+        Melewati __post_init__ karena data sudah lolos validasi saat disimpan.
+        hashed_password bernilai None jika kolom tersebut tidak di-load.
+        Semua field wajib diberikan; kecocokan daftar parameter dengan field
+        dataclass dicek sekali saat modul di-import.
+        """
+        user = object.__new__(cls)
+        user.id = id
+        user.email = email
+        user.username = username
+        user.full_name = full_name
+        user.hashed_password = hashed_password
+        user.is_active = is_active
+        user.is_verified = is_verified
+        user.created_at = created_at
+        user.updated_at = updated_at
+        return user
+    
     def activate(self):
         """Aktifkan akun user"""
         self.is_active = True
@@ -58,3 +94,8 @@ class User:
             self.username = username
         self.updated_at = datetime.utcnow()
 
+
+# from_trusted mengisi slot secara eksplisit demi kecepatan; pastikan field
+# baru di User juga ditambahkan ke sana
+if set(inspect.signature(User.from_trusted).parameters) != {f.name for f in fields(User)}:
+    raise TypeError("User.from_trusted harus mengisi semua field User")
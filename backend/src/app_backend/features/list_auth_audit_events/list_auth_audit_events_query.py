@@ -0,0 +1,65 @@
+"""
+List Auth Audit Events Feature - Query Handler
+Fitur untuk membaca audit log autentikasi milik user
+"""
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app_backend.models.auth_audit_log import AuthAuditLogModel
+from app_backend.shared.database import execute_read
+
+
+@dataclass
+class ListAuthAuditEventsQuery:
+    """Query untuk daftar event audit user dalam rentang waktu"""
+    user_id: uuid.UUID
+    start: datetime
+    end: datetime
+    limit: int = 100
+
+
+@dataclass
+class ListAuthAuditEventsResult:
+    """Result dari query audit log"""
+    events: list = field(default_factory=list)
+
+
+def list_auth_audit_events_query_handler(
+    query: ListAuthAuditEventsQuery,
+    session: Session,
+    primary_session: Optional[Session] = None
+) -> ListAuthAuditEventsResult:
+    """
+    Handle query audit log autentikasi
+    
+    Filter pada created_at membatasi partisi yang dipindai, dan urutan
+    (user_id, created_at) memakai index ix_auth_audit_log_user_id_created_at.
+    Event yang masih di buffer (belum di-flush) belum terlihat.
+    
+    `session` boleh berupa session read replica; jika query di replica gagal
+    dan `primary_session` diberikan, query diulang di primary.
+    """
+    statement = (
+        select(
+            AuthAuditLogModel.id,
+            AuthAuditLogModel.created_at,
+            AuthAuditLogModel.event_type,
+            AuthAuditLogModel.ip_address,
+            AuthAuditLogModel.detail,
+        )
+        .where(
+            AuthAuditLogModel.user_id == query.user_id,
+            AuthAuditLogModel.created_at >= query.start,
+            AuthAuditLogModel.created_at < query.end,
+        )
+        .order_by(AuthAuditLogModel.created_at.desc())
+        .limit(query.limit)
+    )
+    rows = execute_read(statement, session, primary_session).all()
+    
+    return ListAuthAuditEventsResult(events=rows)
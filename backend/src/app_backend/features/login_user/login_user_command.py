@@ -2,13 +2,17 @@
 Login User Feature - Command Handler
 Fitur untuk login dan autentikasi user
 """
+import uuid
 from dataclasses import dataclass
 from typing import Optional
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app_backend.models.user import UserModel
+from app_backend.models.user import UserModel, USER_CREDENTIAL_COLUMNS
 from app_backend.schemas.user import UserLogin
+from app_backend.shared.audit import AuditEvent, AuditEventType, auth_audit_log
+from app_backend.shared.database import read_first
 from app_backend.shared.security import verify_password, create_access_token
 
 
@@ -21,6 +25,7 @@ class LoginUserException(Exception):
 class LoginUserCommand:
     """Command untuk login user"""
     payload: UserLogin
+    client_ip: Optional[str] = None
 
 
 @dataclass
@@ -35,9 +40,26 @@ class LoginUserResult:
         return self.error_message is not None
 
 
+def _record_login(
+    command: LoginUserCommand,
+    event_type: AuditEventType,
+    user_id: Optional[uuid.UUID] = None,
+    detail: Optional[str] = None
+) -> None:
+    """Catat percobaan login ke audit log"""
+    auth_audit_log.record(AuditEvent(
+        event_type=event_type,
+        user_id=user_id,
+        email=command.payload.email,
+        ip_address=command.client_ip,
+        detail=detail
+    ))
+
+
 def login_user_command_handler(
     command: LoginUserCommand, 
-    session: Session
+    session: Session,
+    primary_session: Optional[Session] = None
 ) -> LoginUserResult:
     """
     Handle login user
@@ -47,22 +69,31 @@ def login_user_command_handler(
     2. Password harus cocok
     3. User harus aktif
     4. Generate JWT token jika autentikasi berhasil
+    5. Setiap percobaan login dicatat ke audit log (tanpa query tambahan)
+    
+    `session` boleh berupa session read replica. Jika user tidak ditemukan
+    di sana (atau query di replica gagal) dan `primary_session` diberikan,
+    pencarian diulang di primary agar user yang baru registrasi tetap bisa login.
     """
     
-    # Cari user berdasarkan email
-    user = session.query(UserModel).filter(
+    # Cari user berdasarkan email (hanya kolom yang dibutuhkan untuk autentikasi)
+    query = select(*USER_CREDENTIAL_COLUMNS).where(
         UserModel.email == command.payload.email
-    ).first()
+    )
+    user = read_first(query, session, primary_session)
     
     if not user:
+        _record_login(command, AuditEventType.LOGIN_FAILURE, detail="unknown_email")
         return LoginUserResult(error_message="Email atau password salah")
     
     # Verifikasi password
     if not verify_password(command.payload.password, user.hashed_password):
+        _record_login(command, AuditEventType.LOGIN_FAILURE, user.id, "invalid_password")
         return LoginUserResult(error_message="Email atau password salah")
     
     # Cek apakah user aktif
     if not user.is_active:
+        _record_login(command, AuditEventType.LOGIN_FAILURE, user.id, "inactive")
         return LoginUserResult(error_message="Akun dinonaktifkan")
     
     # Buat access token
@@ -73,6 +104,7 @@ def login_user_command_handler(
     }
     
     access_token = create_access_token(data=token_data)
+    _record_login(command, AuditEventType.LOGIN_SUCCESS, user.id)
     
     return LoginUserResult(
         access_token=access_token,
@@ -6,6 +6,8 @@ import uuid
 from dataclasses import dataclass
 from typing import Optional
 
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app_backend.domain.user import User as DomainUser
@@ -51,17 +53,17 @@ def register_user_command_handler(
     """
     
     # Cek apakah email sudah ada
-    existing_email = session.query(UserModel).filter(
-        UserModel.email == command.payload.email
-    ).first()
+    existing_email = session.execute(
+        select(UserModel.id).where(UserModel.email == command.payload.email).limit(1)
+    ).scalar()
     
     if existing_email:
         return RegisterUserResult(error_message="Email sudah terdaftar")
     
     # Cek apakah username sudah ada
-    existing_username = session.query(UserModel).filter(
-        UserModel.username == command.payload.username
-    ).first()
+    existing_username = session.execute(
+        select(UserModel.id).where(UserModel.username == command.payload.username).limit(1)
+    ).scalar()
     
     if existing_username:
         return RegisterUserResult(error_message="Username sudah digunakan")
@@ -85,11 +87,18 @@ def register_user_command_handler(
         session.refresh(user_model)
         
         # Convert kembali ke domain model untuk return
-        return RegisterUserResult(user=user_model.to_domain())
+        user = user_model.to_domain()
+        return RegisterUserResult(user=user)
         
     except ValueError as e:
         # Error validasi domain
         return RegisterUserResult(error_message=str(e))
-    except Exception as e:
+    except IntegrityError:
+        # Request lain mendaftarkan email/username yang sama di antara cek dan commit
         session.rollback()
-        return RegisterUserResult(error_message=f"Registrasi gagal: {str(e)}")
+        return RegisterUserResult(error_message="Email atau username sudah terdaftar")
+    except Exception:
+        # Error tak terduga (mis. database tidak tersedia) bukan kesalahan
+        # client; biarkan naik sebagai 500 agar tidak disimpan sebagai 409
+        session.rollback()
+        raise
@@ -2,19 +2,49 @@
 FastAPI Application
 Entry point aplikasi FastAPI
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app_backend.conf.settings import settings
 from app_backend.shared.database import engine, Base
-from app_backend.routers.api import auth
+from app_backend.shared.load_shedding import LoadSheddingMiddleware
+from app_backend.routers import well_known
+from app_backend.routers.api import audit, auth, events
+from app_backend.shared.audit import auth_audit_log
+from app_backend.shared.security import get_key_ring
 
 # Buat semua tabel database
 Base.metadata.create_all(bind=engine)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Jalankan flusher audit log selama aplikasi hidup"""
+    # Load key JWT saat startup agar konfigurasi key yang salah menggagalkan
+    # boot, bukan request pertama
+    get_key_ring()
+    auth_audit_log.start()
+    yield
+    auth_audit_log.stop()
+
+
 app = FastAPI(
     title="IPB Internship and Career Tracker API",
     description="API untuk tracking magang dan karir mahasiswa IPB",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
+)
+
+# Load shedding (ditambahkan sebelum CORS agar response 503 tetap punya header CORS)
+app.add_middleware(
+    LoadSheddingMiddleware,
+    initial_limit=settings.concurrency_initial_limit,
+    min_limit=settings.concurrency_min_limit,
+    max_limit=settings.concurrency_max_limit,
+    target_latency=settings.concurrency_target_latency_seconds,
+    retry_after_seconds=settings.load_shedding_retry_after_seconds,
 )
 
 # Konfigurasi CORS
@@ -28,6 +58,9 @@ app.add_middleware(
 
 # Include routers
 app.include_router(auth.router)
+app.include_router(events.router)
+app.include_router(audit.router)
+app.include_router(well_known.router)
 
 
 @app.get("/", tags=["root"])
@@ -44,4 +77,4 @@ async def root():
 @app.get("/health", tags=["health"])
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy"}
+    return {"status": "healthy", "audit_log": auth_audit_log.stats()}
@@ -0,0 +1,29 @@
+"""
+ORM Model - Audit log autentikasi
+Tabel di-partisi per bulan (RANGE created_at) agar retensi cukup drop partisi
+"""
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, Index
+from datetime import datetime
+import uuid as uuid_lib
+
+from app_backend.shared.database import Base
+
+
+class AuthAuditLogModel(Base):
+    """ORM Model for auth_audit_log table"""
+    
+    __tablename__ = "auth_audit_log"
+    __table_args__ = (
+        Index("ix_auth_audit_log_user_id_created_at", "user_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    # Primary key tabel partisi harus memuat kolom partisi
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid_lib.uuid4)
+    created_at = Column(DateTime, primary_key=True, default=datetime.utcnow)
+    event_type = Column(String, nullable=False)
+    user_id = Column(UUID(as_uuid=True), nullable=True)
+    email = Column(String, nullable=True)
+    ip_address = Column(String, nullable=True)
+    detail = Column(String, nullable=True)
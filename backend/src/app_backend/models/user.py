@@ -6,6 +6,7 @@ from sqlalchemy import Boolean, Column, String, DateTime
 from datetime import datetime
 import uuid as uuid_lib
 
+from app_backend.domain.user import User
 from app_backend.shared.database import Base
 
 
@@ -26,9 +27,7 @@ class UserModel(Base):
     
     def to_domain(self):
         """Convert ORM model to domain model"""
-        from app_backend.domain.user import User
-        
-        return User(
+        return User.from_trusted(
             id=self.id,
             email=self.email,
             username=self.username,
@@ -43,6 +42,9 @@ class UserModel(Base):
     @staticmethod
     def from_domain(user):
         """Create ORM model from domain model"""
+        if user.hashed_password is None:
+            raise ValueError("User tanpa hashed_password tidak bisa disimpan")
+        
         return UserModel(
             id=user.id,
             email=user.email,
@@ -54,3 +56,44 @@ class UserModel(Base):
             created_at=user.created_at,
             updated_at=user.updated_at
         )
+
+
+# Kolom yang dibutuhkan read path yang tidak memerlukan password
+# (mis. get_current_user). Dipakai dengan select(*USER_PROFILE_COLUMNS)
+# sehingga hasilnya berupa row tuple tanpa melewati identity map.
+USER_PROFILE_COLUMNS = (
+    UserModel.id,
+    UserModel.email,
+    UserModel.username,
+    UserModel.full_name,
+    UserModel.is_active,
+    UserModel.is_verified,
+    UserModel.created_at,
+    UserModel.updated_at,
+)
+
+# Kolom minimal untuk autentikasi login
+USER_CREDENTIAL_COLUMNS = (
+    UserModel.id,
+    UserModel.email,
+    UserModel.username,
+    UserModel.hashed_password,
+    UserModel.is_active,
+)
+
+
+def profile_row_to_domain(row) -> User:
+    """Convert row hasil select(*USER_PROFILE_COLUMNS) ke domain model"""
+    # Unpack posisi (urutan USER_PROFILE_COLUMNS); akses Row per nama jauh lebih lambat
+    id, email, username, full_name, is_active, is_verified, created_at, updated_at = row
+    return User.from_trusted(
+        id=id,
+        email=email,
+        username=username,
+        full_name=full_name,
+        hashed_password=None,
+        is_active=is_active,
+        is_verified=is_verified,
+        created_at=created_at,
+        updated_at=updated_at
+    )
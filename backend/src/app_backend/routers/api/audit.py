@@ -0,0 +1,71 @@
+"""
+Audit Router - API endpoints untuk audit log autentikasi
+Berisi endpoint untuk melihat riwayat login dan logout user
+"""
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app_backend.domain.user import User as DomainUser
+from app_backend.features.list_auth_audit_events.list_auth_audit_events_query import (
+    ListAuthAuditEventsQuery,
+    list_auth_audit_events_query_handler,
+)
+from app_backend.schemas.audit import AuthAuditEventResponse
+from app_backend.shared.database import get_read_session, get_session
+from app_backend.shared.dependencies import get_current_active_user
+
+router = APIRouter(
+    prefix="/api/audit",
+    tags=["audit"]
+)
+
+DEFAULT_RANGE = timedelta(days=30)
+
+
+def _to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Kolom created_at menyimpan UTC tanpa timezone"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+@router.get("/me", response_model=list[AuthAuditEventResponse])
+def list_my_auth_events(
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: int = Query(100, ge=1, le=500),
+    current_user: DomainUser = Depends(get_current_active_user),
+    session=Depends(get_read_session),
+    primary_session=Depends(get_session),
+) -> list[AuthAuditEventResponse]:
+    """
+    Riwayat login dan logout user yang sedang login
+    
+    - **start**: Awal rentang waktu (UTC jika tanpa timezone), default 30 hari sebelum `end`
+    - **end**: Akhir rentang waktu (UTC jika tanpa timezone), default sekarang
+    - **limit**: Jumlah event maksimum, terbaru lebih dulu
+    """
+    end = _to_naive_utc(end) or datetime.utcnow()
+    start = _to_naive_utc(start) or end - DEFAULT_RANGE
+    
+    if start >= end:
+        raise HTTPException(
+            status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+            detail="start harus lebih awal dari end"
+        )
+    
+    result = list_auth_audit_events_query_handler(
+        query=ListAuthAuditEventsQuery(
+            user_id=current_user.id,
+            start=start,
+            end=end,
+            limit=limit,
+        ),
+        session=session,
+        primary_session=primary_session,
+    )
+    
+    return [AuthAuditEventResponse.model_validate(event) for event in result.events]
@@ -4,7 +4,7 @@ Berisi semua endpoint untuk registrasi, login, dan manajemen user
 """
 from http import HTTPStatus
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 
 from app_backend.features.register_user.register_user_command import (
     RegisterUserCommand,
@@ -15,18 +15,23 @@ from app_backend.features.login_user.login_user_command import (
     login_user_command_handler,
 )
 from app_backend.schemas.user import UserCreate, UserLogin, UserResponse, Token
-from app_backend.shared.database import get_session
+from app_backend.shared.audit import AuditEvent, AuditEventType, auth_audit_log
+from app_backend.shared.database import get_session, get_read_session
 from app_backend.shared.dependencies import get_current_user, get_current_active_user
+from app_backend.shared.idempotency import IdempotentRoute, idempotency_exempt
 from app_backend.domain.user import User as DomainUser
 
 router = APIRouter(
     prefix="/api/auth",
-    tags=["authentication"]
+    tags=["authentication"],
+    route_class=IdempotentRoute
 )
 
 
+# Handler register dan login sengaja sync (def) agar bcrypt berjalan di
+# threadpool dan tidak memblokir event loop untuk request lain
 @router.post("/register", response_model=UserResponse, status_code=HTTPStatus.CREATED)
-async def register(
+def register(
     user_data: UserCreate,
     session=Depends(get_session),
 ) -> UserResponse:
@@ -64,9 +69,12 @@ async def register(
 
 
 @router.post("/login", response_model=Token)
-async def login(
+@idempotency_exempt
+def login(
+    request: Request,
     credentials: UserLogin,
-    session=Depends(get_session),
+    session=Depends(get_read_session),
+    primary_session=Depends(get_session),
 ) -> Token:
     """
     Login dengan email dan password
@@ -77,8 +85,12 @@ async def login(
     - **password**: Password user
     """
     result = login_user_command_handler(
-        command=LoginUserCommand(payload=credentials),
+        command=LoginUserCommand(
+            payload=credentials,
+            client_ip=request.client.host if request.client else None,
+        ),
         session=session,
+        primary_session=primary_session,
     )
 
     if result.got_error():
@@ -117,6 +129,7 @@ async def get_current_user_info(
 
 @router.post("/logout", status_code=HTTPStatus.NO_CONTENT)
 async def logout(
+    request: Request,
     current_user: DomainUser = Depends(get_current_user)
 ):
     """
@@ -128,4 +141,10 @@ async def logout(
     """
     # Dalam sistem JWT stateless, logout biasanya ditangani client-side
     # Jika butuh token blacklisting di server-side, implementasikan di sini
+    auth_audit_log.record(AuditEvent(
+        event_type=AuditEventType.LOGOUT,
+        user_id=current_user.id,
+        email=current_user.email,
+        ip_address=request.client.host if request.client else None,
+    ))
     return None
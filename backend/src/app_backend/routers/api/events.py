@@ -0,0 +1,112 @@
+"""
+Events Router - API endpoint untuk server push
+Berisi stream Server-Sent Events untuk perubahan state milik user
+"""
+import time
+import uuid
+from http import HTTPStatus
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import select
+from starlette.concurrency import run_in_threadpool
+
+from app_backend.conf.settings import settings
+from app_backend.domain.user import User as DomainUser
+from app_backend.models.user import UserModel
+from app_backend.shared import database
+from app_backend.shared.dependencies import get_current_active_user, security
+from app_backend.shared.events import Subscription, event_broker
+from app_backend.shared.security import decode_access_token
+
+router = APIRouter(
+    prefix="/api/events",
+    tags=["events"]
+)
+
+HEARTBEAT = b": heartbeat\n\n"
+
+# Dikirim tanpa id (Last-Event-ID client tidak berubah) sebelum stream ditutup
+# karena access token kedaluwarsa; client reconnect dengan token baru
+AUTH_EXPIRED = b"event: auth_expired\ndata: {}\n\n"
+
+
+def _user_is_active(user_id: uuid.UUID) -> bool:
+    """Cek ulang di primary bahwa user masih ada dan aktif"""
+    with database.SessionLocal() as session:
+        return bool(session.execute(
+            select(UserModel.is_active).where(UserModel.id == user_id)
+        ).scalar())
+
+
+async def _event_stream(
+    subscription: Subscription,
+    user_id: uuid.UUID,
+    expires_at: float
+) -> AsyncIterator[bytes]:
+    """
+    Ubah subscription menjadi stream SSE dengan heartbeat
+
+    Stream ditutup saat access token kedaluwarsa (expires_at, epoch detik)
+    atau saat pengecekan berkala menemukan user sudah tidak aktif.
+    """
+    try:
+        # Minta client menunggu sebelum reconnect otomatis
+        yield b"retry: 3000\n\n"
+        while True:
+            recheck_at = time.time() + settings.events_user_recheck_seconds
+            async for event in subscription.events(
+                settings.events_heartbeat_seconds,
+                until=min(expires_at, recheck_at),
+            ):
+                yield HEARTBEAT if event is None else event.encode()
+
+            if subscription.overflowed:
+                return
+            if time.time() >= expires_at:
+                yield AUTH_EXPIRED
+                return
+            if not await run_in_threadpool(_user_is_active, user_id):
+                return
+    finally:
+        event_broker.unsubscribe(subscription)
+
+
+@router.get("/stream")
+async def stream_events(
+    current_user: DomainUser = Depends(get_current_active_user),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    last_event_id: Optional[str] = Header(None),
+) -> StreamingResponse:
+    """
+    Stream Server-Sent Events untuk user yang sedang login
+    
+    Memerlukan JWT token yang valid di Authorization header. Kirim header
+    `Last-Event-ID` saat reconnect untuk menerima event yang terlewat; event
+    `reset` berarti client harus mengambil ulang state lewat REST, event
+    `auth_expired` berarti access token kedaluwarsa dan stream ditutup.
+    """
+    try:
+        resume_from = int(last_event_id) if last_event_id else None
+    except ValueError:
+        resume_from = None
+    
+    # Token sudah diverifikasi get_current_active_user, tapi bisa kedaluwarsa
+    # di antara dua decode
+    payload = decode_access_token(credentials.credentials)
+    if payload is None:
+        raise HTTPException(
+            status_code=HTTPStatus.UNAUTHORIZED,
+            detail="Kredensial tidak valid",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    expires_at = float(payload["exp"])
+    
+    subscription = event_broker.subscribe(str(current_user.id), last_event_id=resume_from)
+    return StreamingResponse(
+        _event_stream(subscription, current_user.id, expires_at),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
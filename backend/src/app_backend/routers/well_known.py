@@ -0,0 +1,31 @@
+"""
+Well-Known Router - Endpoint metadata publik
+Berisi JWKS untuk verifikasi JWT secara lokal oleh service lain
+"""
+from fastapi import APIRouter, Response
+
+from app_backend.conf.settings import settings
+from app_backend.shared.security import get_key_ring
+
+router = APIRouter(
+    prefix="/.well-known",
+    tags=["well-known"]
+)
+
+EMPTY_JWKS = b'{"keys":[]}'
+
+
+@router.get("/jwks.json")
+async def jwks() -> Response:
+    """
+    JSON Web Key Set berisi public key untuk verifikasi access token
+    
+    Token memuat `kid` di header untuk memilih key. Kosong jika API
+    menggunakan signing simetris.
+    """
+    key_ring = get_key_ring()
+    return Response(
+        content=key_ring.jwks_body if key_ring is not None else EMPTY_JWKS,
+        media_type="application/json",
+        headers={"Cache-Control": f"public, max-age={settings.jwks_cache_max_age_seconds}"},
+    )
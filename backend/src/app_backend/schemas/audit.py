@@ -0,0 +1,20 @@
+"""Pydantic schemas untuk response audit log autentikasi.
+
+Berisi schema untuk daftar event audit milik user
+"""
+import uuid
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+
+
+class AuthAuditEventResponse(BaseModel):
+    """Schema untuk satu event audit"""
+    id: uuid.UUID
+    created_at: datetime
+    event_type: str
+    ip_address: Optional[str] = None
+    detail: Optional[str] = None
+    
+    class Config:
+        from_attributes = True
@@ -0,0 +1,157 @@
+"""
+Benchmark Read Path Script
+Microbenchmark read path get_current_user: read path lama vs column projection
+
+Tiga bagian diukur terpisah agar biaya session dan I/O database tidak
+menenggelamkan biaya mapping:
+1. Konstruksi domain User: User(...) dengan validasi vs User.from_trusted(...)
+2. Mapping hasil query ke domain: ORM entity -> User(...) (read path lama)
+   vs row tuple -> profile_row_to_domain
+3. Query dalam satu session: load ORM entity lewat identity map vs select
+   kolom profil sebagai row tuple
+"""
+import gc
+import timeit
+import tracemalloc
+import uuid
+from datetime import datetime
+
+import click
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from app_backend.domain.user import User
+from app_backend.models.user import UserModel, USER_PROFILE_COLUMNS, profile_row_to_domain
+from app_backend.shared.database import Base
+
+
+def _legacy_to_domain(user: UserModel) -> User:
+    """Mapping read path lama: entity penuh ke User dengan validasi"""
+    return User(
+        id=user.id,
+        email=user.email,
+        username=user.username,
+        full_name=user.full_name,
+        hashed_password=user.hashed_password,
+        is_active=user.is_active,
+        is_verified=user.is_verified,
+        created_at=user.created_at,
+        updated_at=user.updated_at
+    )
+
+
+def _time_per_call(func, number: int, repeat: int = 5) -> float:
+    """Waktu terbaik per panggilan dalam detik"""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def _allocations_per_call(func, number: int) -> tuple[float, float, float]:
+    """
+    Alokasi memori per panggilan: (blok tertahan, byte tertahan, peak byte sementara)
+
+    Hasil setiap panggilan ditahan sampai snapshot kedua diambil, sehingga
+    selisih snapshot adalah memori yang tetap dipakai oleh hasil panggilan.
+    Peak sementara adalah memori maksimum selama satu panggilan berjalan,
+    termasuk objek perantara yang langsung dibebaskan.
+    """
+    results = []
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    peak_total = 0
+    for _ in range(number):
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        results.append(func())
+        _, peak = tracemalloc.get_traced_memory()
+        peak_total += peak - baseline
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = [
+        stat for stat in after.compare_to(before, "filename")
+        if stat.traceback[0].filename != __file__
+    ]
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    del results
+    return blocks / number, size / number, peak_total / number
+
+
+def _echo(name: str, seconds: float, allocations: tuple, unit: str, scale: float):
+    blocks, size, peak = allocations
+    click.echo(
+        f"  {name:<34} {seconds * scale:8.2f} {unit}/call "
+        f"{blocks:5.1f} blocks {size:7.1f} B tertahan {peak:8.1f} B peak"
+    )
+
+
+def _report(title: str, candidates: dict, number: int):
+    click.echo(title)
+    for name, func in candidates.items():
+        _echo(name, _time_per_call(func, number), _allocations_per_call(func, number), "us", 1e6)
+
+
+@click.command()
+@click.option('--number', default=20_000, help='Jumlah panggilan per pengukuran')
+def benchmark_read_path(number: int):
+    """Bandingkan biaya read path lama dan baru get_current_user"""
+    now = datetime.utcnow()
+    values = dict(
+        id=uuid.uuid4(),
+        email="test@example.com",
+        username="testuser",
+        full_name="Test User",
+        hashed_password="$2b$12$" + "x" * 53,
+        is_active=True,
+        is_verified=True,
+        created_at=now,
+        updated_at=now,
+    )
+    _report("Konstruksi User", {
+        "User(...) (validasi)": lambda: User(**values),
+        "User.from_trusted(...)": lambda: User.from_trusted(**values),
+    }, number)
+
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(bind=engine, tables=[UserModel.__table__])
+    session_factory = sessionmaker(bind=engine)
+    with session_factory.begin() as session:
+        session.add(UserModel(**values))
+
+    with session_factory() as session:
+        entity = session.query(UserModel).filter(UserModel.id == values["id"]).first()
+        row = session.execute(
+            select(*USER_PROFILE_COLUMNS).where(UserModel.id == values["id"])
+        ).first()
+        _report("Mapping hasil query ke User", {
+            "entity -> User(...) (lama)": lambda: _legacy_to_domain(entity),
+            "row -> profile_row_to_domain": lambda: profile_row_to_domain(row),
+        }, number)
+
+    def orm_lookup(session):
+        user = session.query(UserModel).filter(UserModel.id == values["id"]).first()
+        return _legacy_to_domain(user)
+
+    def projected_lookup(session):
+        row = session.execute(
+            select(*USER_PROFILE_COLUMNS).where(UserModel.id == values["id"])
+        ).first()
+        return profile_row_to_domain(row)
+
+    # expunge_all di antara panggilan agar entity tidak diambil dari identity map
+    click.echo("Query dalam satu session")
+    queries = max(number // 20, 1)
+    for name, lookup in {
+        "orm entity + identity map (lama)": orm_lookup,
+        "column projection": projected_lookup,
+    }.items():
+        with session_factory() as session:
+            def call():
+                session.expunge_all()
+                return lookup(session)
+            _echo(name, _time_per_call(call, queries), _allocations_per_call(call, queries), "us", 1e6)
+
+
+if __name__ == '__main__':
+    benchmark_read_path()
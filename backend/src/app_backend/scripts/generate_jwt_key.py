@@ -0,0 +1,34 @@
+"""
+Generate JWT Key Script
+Script untuk membuat RSA private key baru untuk rotasi signing key JWT
+"""
+from pathlib import Path
+
+import click
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+
+@click.command()
+@click.argument('output', type=click.Path(dir_okay=False, path_type=Path))
+@click.option('--key-size', default=2048, help='Ukuran RSA key dalam bit')
+def generate_jwt_key(output: Path, key_size: int):
+    """Tulis RSA private key (PEM) ke OUTPUT"""
+    if output.exists():
+        raise click.ClickException(f'{output} sudah ada')
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+    output.write_bytes(
+        private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+    )
+    output.chmod(0o600)
+    click.echo(f'Private key ditulis ke {output}')
+    click.echo('Tambahkan ke JWT_PRIVATE_KEY_FILES dengan kid baru, lalu set JWT_ACTIVE_KID')
+
+
+if __name__ == '__main__':
+    generate_jwt_key()
@@ -0,0 +1,28 @@
+"""
+Init Replica Schema Script
+Script untuk membuat schema di database stand-in replica untuk testing lokal
+"""
+import click
+from sqlalchemy import create_engine
+
+from app_backend.conf.settings import settings
+from app_backend.models import auth_audit_log, user  # noqa: F401  (daftarkan tabel ke Base.metadata)
+from app_backend.shared.database import Base
+
+
+@click.command()
+def init_replica_schema():
+    """Buat semua tabel di setiap DB_REPLICA_URLS"""
+    if not settings.db_replica_urls:
+        raise click.ClickException('DB_REPLICA_URLS kosong')
+
+    for url in settings.db_replica_urls:
+        # Hanya untuk database lokal biasa yang dipakai sebagai stand-in;
+        # replica streaming asli read-only dan mendapat schema dari primary
+        replica = create_engine(url)
+        Base.metadata.create_all(bind=replica)
+        click.echo(f'Schema dibuat di {replica.url.render_as_string(hide_password=True)}')
+
+
+if __name__ == '__main__':
+    init_replica_schema()
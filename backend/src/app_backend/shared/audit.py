@@ -0,0 +1,231 @@
+"""
+Audit log autentikasi dengan penulisan batch asinkron
+Event ditampung di ring buffer dan di-insert secara bulk oleh thread flusher
+"""
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import Callable, Optional
+
+from sqlalchemy import insert, text
+from sqlalchemy.orm import Session
+
+from app_backend.conf.settings import settings
+from app_backend.models.auth_audit_log import AuthAuditLogModel
+from app_backend.shared.database import SessionLocal
+
+PARTITION_PREFIX = f"{AuthAuditLogModel.__tablename__}_"
+
+logger = logging.getLogger(__name__)
+
+
+class AuditEventType(str, Enum):
+    """Jenis event audit autentikasi"""
+    LOGIN_SUCCESS = "login_success"
+    LOGIN_FAILURE = "login_failure"
+    LOGOUT = "logout"
+
+
+@dataclass(frozen=True, slots=True)
+class AuditEvent:
+    """Satu event audit yang menunggu di-flush"""
+    event_type: AuditEventType
+    user_id: Optional[uuid.UUID] = None
+    email: Optional[str] = None
+    ip_address: Optional[str] = None
+    detail: Optional[str] = None
+    id: uuid.UUID = field(default_factory=uuid.uuid4)
+    created_at: datetime = field(default_factory=datetime.utcnow)
+
+
+def _month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def _next_month(month: date) -> date:
+    return (month.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def _partition_name(month: date) -> str:
+    return f"{PARTITION_PREFIX}{month:%Y%m}"
+
+
+def ensure_partition(session: Session, month: date) -> None:
+    """Buat partisi bulanan untuk bulan yang memuat `month` jika belum ada"""
+    start = _month_start(month)
+    session.execute(text(
+        f'CREATE TABLE IF NOT EXISTS "{_partition_name(start)}" '
+        f'PARTITION OF "{AuthAuditLogModel.__tablename__}" '
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{_next_month(start).isoformat()}')"
+    ))
+
+
+def drop_expired_partitions(session: Session, retention_days: int, today: date) -> list[str]:
+    """Drop partisi yang seluruh isinya lebih lama dari masa retensi"""
+    cutoff = today - timedelta(days=retention_days)
+    partitions = session.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :parent"
+        ),
+        {"parent": AuthAuditLogModel.__tablename__},
+    ).scalars()
+
+    dropped = []
+    for name in partitions:
+        try:
+            month = datetime.strptime(name.removeprefix(PARTITION_PREFIX), "%Y%m").date()
+        except ValueError:
+            continue
+        if _next_month(month) <= cutoff:
+            session.execute(text(f'DROP TABLE IF EXISTS "{name}"'))
+            dropped.append(name)
+    return dropped
+
+
+class AuthAuditLog:
+    """
+    Buffer audit log dengan flush batch di background thread
+
+    record() hanya menambahkan event ke ring buffer di memori sehingga tidak
+    menambah query di path login. Thread flusher meng-insert event secara
+    bulk ketika buffer mencapai batch_size atau setiap flush_interval. Jika
+    buffer penuh, event terlama dibuang dan dihitung di `dropped`; event yang
+    gagal di-insert dihitung di `failed`.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        capacity: int,
+        batch_size: int,
+        flush_interval: float,
+        retention_days: int,
+        maintenance_interval: float,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retention_days = retention_days
+        self.maintenance_interval = maintenance_interval
+        self.dropped = 0
+        self.failed = 0
+        self._buffer: deque[AuditEvent] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._partitions: set[date] = set()
+        self._last_maintenance: Optional[float] = None
+
+    def record(self, event: AuditEvent) -> None:
+        """Tambahkan event ke buffer; aman dipanggil dari thread mana pun"""
+        with self._lock:
+            if len(self._buffer) == self._buffer.maxlen:
+                self.dropped += 1
+            self._buffer.append(event)
+            full = len(self._buffer) >= self.batch_size
+        if full:
+            self._wake.set()
+
+    def _take_batch(self) -> list[AuditEvent]:
+        with self._lock:
+            count = min(self.batch_size, len(self._buffer))
+            return [self._buffer.popleft() for _ in range(count)]
+
+    def flush(self) -> int:
+        """Insert semua event di buffer secara bulk, kembalikan jumlah yang tersimpan"""
+        written = 0
+        while batch := self._take_batch():
+            try:
+                with self.session_factory() as session:
+                    for month in {_month_start(e.created_at.date()) for e in batch} - self._partitions:
+                        ensure_partition(session, month)
+                    session.execute(
+                        insert(AuthAuditLogModel),
+                        [
+                            {
+                                "id": e.id,
+                                "created_at": e.created_at,
+                                "event_type": e.event_type.value,
+                                "user_id": e.user_id,
+                                "email": e.email,
+                                "ip_address": e.ip_address,
+                                "detail": e.detail,
+                            }
+                            for e in batch
+                        ],
+                    )
+                    session.commit()
+                self._partitions.update(_month_start(e.created_at.date()) for e in batch)
+                written += len(batch)
+            except Exception:
+                self.failed += len(batch)
+                logger.exception("Gagal menyimpan %d event audit (total gagal: %d)", len(batch), self.failed)
+        return written
+
+    def maintain_partitions(self) -> None:
+        """Siapkan partisi bulan ini dan bulan depan, drop partisi kedaluwarsa"""
+        today = datetime.utcnow().date()
+        months = [_month_start(today), _next_month(_month_start(today))]
+        with self.session_factory() as session:
+            for month in months:
+                ensure_partition(session, month)
+            drop_expired_partitions(session, self.retention_days, today)
+            session.commit()
+        self._partitions.update(months)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(timeout=self.flush_interval)
+            self._wake.clear()
+
+            now = time.monotonic()
+            if self._last_maintenance is None or now - self._last_maintenance >= self.maintenance_interval:
+                try:
+                    self.maintain_partitions()
+                    self._last_maintenance = now
+                except Exception:
+                    logger.exception("Maintenance partisi audit log gagal")
+            self.flush()
+
+    def stats(self) -> dict[str, int]:
+        """Jumlah event di buffer, yang dibuang, dan yang gagal di-insert"""
+        with self._lock:
+            buffered = len(self._buffer)
+        return {"buffered": buffered, "dropped": self.dropped, "failed": self.failed}
+
+    def start(self) -> None:
+        """Jalankan thread flusher"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="auth-audit-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Hentikan thread flusher dan flush sisa event"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
+        self.flush()
+
+
+auth_audit_log = AuthAuditLog(
+    session_factory=SessionLocal,
+    capacity=settings.audit_buffer_capacity,
+    batch_size=settings.audit_batch_size,
+    flush_interval=settings.audit_flush_interval_seconds,
+    retention_days=settings.audit_retention_days,
+    maintenance_interval=settings.audit_partition_maintenance_interval_seconds,
+)
@@ -2,7 +2,14 @@
 Database configuration dan session management
 Konfigurasi koneksi database dan session SQLAlchemy
 """
-from sqlalchemy import create_engine
+import itertools
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine, Result, Row
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -21,11 +28,160 @@ SessionLocal = sessionmaker(
 
 Base = declarative_base()
 
+# Lag replikasi dalam detik. Server yang bukan standby (mis. database lokal
+# yang dipakai sebagai stand-in replica) dianggap tanpa lag.
+REPLICATION_LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+class ReplicaRouter:
+    """
+    Memilih engine read replica secara round-robin
+
+    Setiap replica dicek kesehatannya (koneksi dan lag replikasi) paling
+    sering sekali per health_check_interval. Replica yang gagal dicek atau
+    lag-nya melebihi max_lag_seconds dilewati; jika tidak ada replica yang
+    sehat, pick() mengembalikan None dan pemanggil memakai primary. Selama
+    sebuah replica sedang dicek, request lain menganggapnya tidak sehat
+    sehingga hanya satu request yang menunggu hasil pengecekan.
+    """
+
+    def __init__(
+        self,
+        engines: list[Engine],
+        max_lag_seconds: float,
+        health_check_interval: float,
+    ):
+        self.engines = engines
+        self.max_lag_seconds = max_lag_seconds
+        self.health_check_interval = health_check_interval
+        self._counter = itertools.count()
+        # engine -> (waktu cek terakhir, sehat)
+        self._health: dict[Engine, tuple[float, bool]] = {}
+        self._lock = threading.Lock()
+
+    def _check(self, replica: Engine) -> bool:
+        """Cek koneksi dan lag replikasi sebuah replica"""
+        try:
+            with replica.connect() as connection:
+                lag = connection.execute(REPLICATION_LAG_QUERY).scalar()
+        except Exception:
+            return False
+        return lag is not None and float(lag) <= self.max_lag_seconds
+
+    def is_healthy(self, replica: Engine) -> bool:
+        """Status kesehatan replica, memakai hasil cek yang di-cache"""
+        with self._lock:
+            now = time.monotonic()
+            checked_at, healthy = self._health.get(replica, (None, False))
+            if checked_at is not None and now - checked_at < self.health_check_interval:
+                return healthy
+            # Klaim pengecekan sebelum probe agar request lain tidak ikut probe
+            self._health[replica] = (now, False)
+        
+        healthy = self._check(replica)
+        self._health[replica] = (time.monotonic(), healthy)
+        return healthy
+
+    def mark_unhealthy(self, replica: Engine) -> None:
+        """Tandai replica tidak sehat sampai pengecekan berikutnya"""
+        if replica in self.engines:
+            self._health[replica] = (time.monotonic(), False)
+
+    def pick(self) -> Optional[Engine]:
+        """Pilih replica sehat berikutnya, atau None jika tidak ada"""
+        if not self.engines:
+            return None
+        start = next(self._counter)
+        for offset in range(len(self.engines)):
+            replica = self.engines[(start + offset) % len(self.engines)]
+            if self.is_healthy(replica):
+                return replica
+        return None
+
+
+replica_router = ReplicaRouter(
+    engines=[
+        create_engine(
+            url,
+            pool_pre_ping=True,
+            connect_args={"connect_timeout": settings.db_replica_connect_timeout_seconds},
+        )
+        for url in settings.db_replica_urls
+    ],
+    max_lag_seconds=settings.db_replica_max_lag_seconds,
+    health_check_interval=settings.db_replica_health_check_interval_seconds,
+)
+
 
 def get_session():
-    """Dependency untuk mendapatkan database session"""
+    """Dependency untuk mendapatkan database session (primary)"""
     session = SessionLocal()
     try:
         yield session
     finally:
         session.close()
+
+
+def get_read_session():
+    """
+    Dependency untuk mendapatkan database session read-only
+
+    Diarahkan ke read replica jika ada yang sehat, jika tidak ke primary.
+    Jangan dipakai untuk write atau untuk membaca data yang baru saja ditulis.
+    """
+    replica = replica_router.pick()
+    session = SessionLocal(bind=replica) if replica is not None else SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _execute_read(statement, session, primary_session=None) -> tuple[Result, bool]:
+    """Jalankan query read, kembalikan (result, apakah dijalankan di replica)"""
+    if primary_session is None:
+        return session.execute(statement), session.get_bind() in replica_router.engines
+
+    try:
+        return session.execute(statement), session.get_bind() in replica_router.engines
+    except SQLAlchemyError:
+        bind = session.get_bind()
+        if bind not in replica_router.engines:
+            raise
+        session.rollback()
+        replica_router.mark_unhealthy(bind)
+        return primary_session.execute(statement), False
+
+
+def execute_read(statement, session, primary_session=None) -> Result:
+    """
+    Jalankan query read di session (bisa replica), fallback ke primary jika gagal
+    
+    Jika query di replica gagal (koneksi putus, query dibatalkan karena
+    recovery conflict, tabel belum ada), replica ditandai tidak sehat dan
+    query diulang di primary_session.
+    """
+    result, _ = _execute_read(statement, session, primary_session)
+    return result
+
+
+def read_first(statement, session, primary_session=None) -> Optional[Row]:
+    """
+    Ambil row pertama hasil query read, dengan fallback ke primary
+
+    Selain fallback saat query gagal seperti execute_read, query diulang di
+    primary_session jika row tidak ditemukan di replica (mis. data baru
+    ditulis dan belum tereplikasi). Jika query sudah dijalankan di primary
+    (tidak ada replica sehat atau sudah fallback), tidak ada query ulang.
+    """
+    result, on_replica = _execute_read(statement, session, primary_session)
+    row = result.first()
+    if row is None and on_replica and primary_session is not None:
+        row = primary_session.execute(statement).first()
+    return row
@@ -7,10 +7,11 @@ import uuid
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app_backend.models.user import UserModel
-from app_backend.shared.database import get_session
+from app_backend.models.user import UserModel, USER_PROFILE_COLUMNS, profile_row_to_domain
+from app_backend.shared.database import get_session, get_read_session, read_first
 from app_backend.shared.security import decode_access_token
 from app_backend.domain.user import User as DomainUser
 
@@ -18,13 +19,20 @@ from app_backend.domain.user import User as DomainUser
 security = HTTPBearer()
 
 
-async def get_current_user(
+def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    session: Session = Depends(get_session)
+    session: Session = Depends(get_read_session, scope="function"),
+    primary_session: Session = Depends(get_session, scope="function")
 ) -> DomainUser:
     """
     Dependency untuk mendapatkan user yang sedang login dari JWT token
     
+    User dibaca dari read replica; jika belum ada di replica (mis. baru saja
+    dibuat dan belum tereplikasi) atau query di replica gagal, dibaca ulang
+    dari primary. Sengaja sync (def) agar query berjalan di threadpool dan
+    tidak memblokir event loop. Session ditutup begitu path operation selesai
+    agar response streaming tidak menahan koneksi database.
+    
     Raises:
         HTTPException: Jika token invalid atau user tidak ditemukan
     """
@@ -52,21 +60,22 @@ async def get_current_user(
     except ValueError:
         raise credentials_exception
     
-    # Ambil user dari database
-    user = session.query(UserModel).filter(UserModel.id == user_id).first()
+    # Ambil user dari database (hanya kolom profil, tanpa hashed_password)
+    query = select(*USER_PROFILE_COLUMNS).where(UserModel.id == user_id)
+    row = read_first(query, session, primary_session)
     
-    if user is None:
+    if row is None:
         raise credentials_exception
     
     # Cek apakah user aktif
-    if not user.is_active:
+    if not row.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Akun user dinonaktifkan"
         )
     
     # Convert ke domain model dan return
-    return user.to_domain()
+    return profile_row_to_domain(row)
 
 
 async def get_current_active_user(
@@ -0,0 +1,190 @@
+"""
+In-process pub/sub untuk server push
+Menyebarkan event ke koneksi SSE yang berlangganan per topic (user)
+"""
+import asyncio
+import itertools
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Optional
+
+from app_backend.conf.settings import settings
+
+# Event khusus yang meminta client mengambil ulang state lewat REST karena
+# sebagian event tidak bisa diputar ulang (history terpotong atau buffer penuh)
+RESET_EVENT_TYPE = "reset"
+
+
+@dataclass(frozen=True)
+class Event:
+    """Event yang dikirim ke client"""
+    id: int
+    type: str
+    data: dict[str, Any]
+
+    def encode(self) -> bytes:
+        """Format event sebagai pesan Server-Sent Events"""
+        payload = json.dumps(self.data, separators=(",", ":"), default=str)
+        return f"id: {self.id}\nevent: {self.type}\ndata: {payload}\n\n".encode()
+
+
+@dataclass
+class _TopicHistory:
+    events: deque
+    evicted_up_to: int
+
+
+# Penanda di queue bahwa subscription harus ditutup karena buffer penuh
+_OVERFLOW = object()
+
+
+@dataclass(eq=False)
+class Subscription:
+    """Koneksi yang berlangganan satu topic dengan buffer terbatas"""
+    topic: str
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue
+    overflowed: bool = field(default=False)
+
+    def push(self, event: Event) -> None:
+        """Masukkan event ke buffer; dipanggil di event loop subscription"""
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Client terlalu lambat: kosongkan buffer dan tutup koneksi,
+            # client akan reconnect dengan Last-Event-ID
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(_OVERFLOW)
+
+    async def events(
+        self,
+        heartbeat_seconds: float,
+        until: Optional[float] = None
+    ) -> AsyncIterator[Optional[Event]]:
+        """
+        Iterasi event dari buffer
+
+        Menghasilkan None setiap heartbeat_seconds tanpa event. Berhenti jika
+        buffer sempat penuh atau waktu (time.time()) mencapai `until`.
+        """
+        while True:
+            timeout = heartbeat_seconds
+            if until is not None:
+                remaining = until - time.time()
+                if remaining <= 0:
+                    return
+                timeout = min(timeout, remaining)
+            try:
+                item = await asyncio.wait_for(self.queue.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                if until is not None and time.time() >= until:
+                    return
+                yield None
+                continue
+            if item is _OVERFLOW:
+                return
+            yield item
+
+
+class EventBroker:
+    """
+    Broker pub/sub in-process
+
+    publish() aman dipanggil dari thread mana pun (mis. command handler sync
+    yang berjalan di threadpool). Event disimpan per topic dalam history
+    terbatas untuk resume dengan Last-Event-ID. Hanya berlaku per proses.
+
+    Belum ada producer: publish dari command handler yang mengubah state
+    user yang sudah bisa berlangganan (topic = id user), setelah commit
+    berhasil dan di luar blok try/rollback.
+    """
+
+    def __init__(self, buffer_size: int, history_size: int, max_topics: int):
+        self.buffer_size = buffer_size
+        self.history_size = history_size
+        self.max_topics = max_topics
+        self._lock = threading.Lock()
+        # Id berbasis waktu start agar tetap naik setelah proses restart
+        start = time.time_ns() // 1000
+        self._ids = itertools.count(start)
+        self._evicted_floor = start - 1
+        self._history: OrderedDict[str, _TopicHistory] = OrderedDict()
+        self._subscribers: dict[str, set[Subscription]] = {}
+
+    def _topic_history(self, topic: str) -> _TopicHistory:
+        history = self._history.get(topic)
+        if history is None:
+            history = _TopicHistory(
+                events=deque(maxlen=self.history_size),
+                evicted_up_to=self._evicted_floor,
+            )
+            self._history[topic] = history
+            while len(self._history) > self.max_topics:
+                _, evicted = self._history.popitem(last=False)
+                if evicted.events:
+                    self._evicted_floor = max(self._evicted_floor, evicted.events[-1].id)
+        self._history.move_to_end(topic)
+        return history
+
+    def publish(self, topic: str, event_type: str, data: dict[str, Any]) -> Event:
+        """Kirim event ke semua subscriber topic"""
+        with self._lock:
+            event = Event(id=next(self._ids), type=event_type, data=data)
+            history = self._topic_history(topic)
+            if len(history.events) == history.events.maxlen:
+                history.evicted_up_to = history.events[0].id
+            history.events.append(event)
+            subscribers = list(self._subscribers.get(topic, ()))
+
+        for subscription in subscribers:
+            subscription.loop.call_soon_threadsafe(subscription.push, event)
+        return event
+
+    def subscribe(self, topic: str, last_event_id: Optional[int] = None) -> Subscription:
+        """
+        Berlangganan topic; harus dipanggil dari dalam event loop
+
+        Jika last_event_id diberikan, event setelahnya diputar ulang dari
+        history. Jika sebagian sudah tidak ada di history, subscription
+        diawali event reset.
+        """
+        subscription = Subscription(
+            topic=topic,
+            loop=asyncio.get_running_loop(),
+            queue=asyncio.Queue(maxsize=self.buffer_size),
+        )
+        with self._lock:
+            if last_event_id is not None:
+                history = self._history.get(topic)
+                evicted_up_to = history.evicted_up_to if history else self._evicted_floor
+                backlog = [e for e in history.events if e.id > last_event_id] if history else []
+                if last_event_id < evicted_up_to or len(backlog) >= self.buffer_size:
+                    backlog = [Event(id=last_event_id, type=RESET_EVENT_TYPE, data={})]
+                for event in backlog:
+                    subscription.queue.put_nowait(event)
+            self._subscribers.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Hentikan langganan"""
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.topic)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.topic]
+
+
+event_broker = EventBroker(
+    buffer_size=settings.events_buffer_size,
+    history_size=settings.events_history_size,
+    max_topics=settings.events_max_topics,
+)
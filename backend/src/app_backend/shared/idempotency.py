@@ -0,0 +1,273 @@
+"""
+Idempotency-Key support untuk endpoint POST
+Menyimpan response pertama dan memutar ulang response tersebut untuk retry
+"""
+import asyncio
+import hashlib
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Callable, Coroutine, Optional, Any
+
+from fastapi import HTTPException, Request, Response
+from fastapi.exception_handlers import http_exception_handler
+from fastapi.routing import APIRoute
+
+from app_backend.conf.settings import settings
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+IDEMPOTENCY_REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+# Error client yang pasti berulang untuk request yang sama; status 4xx lain
+# (mis. 401, 403, 429) bisa berubah saat diulang sehingga tidak disimpan
+STORED_CLIENT_ERRORS = frozenset({
+    HTTPStatus.BAD_REQUEST,
+    HTTPStatus.NOT_FOUND,
+    HTTPStatus.CONFLICT,
+    HTTPStatus.UNPROCESSABLE_ENTITY,
+})
+
+
+class IdempotencyKeyConflict(Exception):
+    """Exception saat Idempotency-Key tidak bisa dipakai untuk request ini"""
+
+    def __init__(self, message: str, status_code: int = HTTPStatus.CONFLICT):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@dataclass
+class StoredResponse:
+    """Response yang disimpan untuk diputar ulang apa adanya"""
+    status_code: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+
+
+class IdempotencyStore(ABC):
+    """
+    Interface penyimpanan Idempotency-Key
+
+    Implementasi lain (mis. Redis) cukup meng-override tiga method ini.
+    """
+
+    @abstractmethod
+    async def reserve(self, key: str, fingerprint: str) -> Optional[StoredResponse]:
+        """
+        Klaim key untuk diproses oleh pemanggil
+
+        Mengembalikan None jika key berhasil diklaim. Jika key sudah selesai
+        diproses, mengembalikan response yang tersimpan; jika sedang diproses
+        request lain, menunggu sampai selesai.
+
+        Raises:
+            IdempotencyKeyConflict: Jika key dipakai untuk request berbeda
+                atau request pertama tidak selesai dalam batas waktu
+        """
+
+    @abstractmethod
+    async def complete(self, key: str, response: StoredResponse) -> None:
+        """Simpan response untuk key yang sudah diklaim"""
+
+    @abstractmethod
+    async def release(self, key: str) -> None:
+        """Lepas klaim tanpa menyimpan response (request boleh diulang)"""
+
+
+@dataclass
+class _InFlight:
+    fingerprint: str
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+    response: Optional[StoredResponse] = None
+
+
+@dataclass
+class _Completed:
+    fingerprint: str
+    expires_at: float
+    response: StoredResponse
+
+
+class InMemoryIdempotencyStore(IdempotencyStore):
+    """
+    Penyimpanan Idempotency-Key di memori proses
+
+    Response yang selesai disimpan dalam LRU dengan TTL dan jumlah entry
+    maksimum. Hanya berlaku per proses; untuk beberapa worker gunakan
+    implementasi IdempotencyStore yang terpusat.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int, wait_timeout: float):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.wait_timeout = wait_timeout
+        self._in_flight: dict[str, _InFlight] = {}
+        self._completed: OrderedDict[str, _Completed] = OrderedDict()
+
+    def _get_completed(self, key: str) -> Optional[_Completed]:
+        entry = self._completed.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._completed[key]
+            return None
+        self._completed.move_to_end(key)
+        return entry
+
+    async def reserve(self, key: str, fingerprint: str) -> Optional[StoredResponse]:
+        completed = self._get_completed(key)
+        if completed is not None:
+            if completed.fingerprint != fingerprint:
+                raise _fingerprint_mismatch()
+            return completed.response
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is None:
+            self._in_flight[key] = _InFlight(fingerprint=fingerprint)
+            return None
+
+        if in_flight.fingerprint != fingerprint:
+            raise _fingerprint_mismatch()
+        try:
+            await asyncio.wait_for(in_flight.done.wait(), timeout=self.wait_timeout)
+        except asyncio.TimeoutError:
+            raise IdempotencyKeyConflict("Request dengan Idempotency-Key ini masih diproses")
+
+        if in_flight.response is None:
+            # Request pertama gagal tanpa response; klaim ulang untuk pemanggil ini
+            return await self.reserve(key, fingerprint)
+        return in_flight.response
+
+    async def complete(self, key: str, response: StoredResponse) -> None:
+        in_flight = self._in_flight.pop(key, None)
+        if in_flight is None:
+            return
+        in_flight.response = response
+        in_flight.done.set()
+
+        self._completed[key] = _Completed(
+            fingerprint=in_flight.fingerprint,
+            expires_at=time.monotonic() + self.ttl_seconds,
+            response=response,
+        )
+        self._completed.move_to_end(key)
+        while len(self._completed) > self.max_entries:
+            self._completed.popitem(last=False)
+
+    async def release(self, key: str) -> None:
+        in_flight = self._in_flight.pop(key, None)
+        if in_flight is not None:
+            in_flight.done.set()
+
+
+def _fingerprint_mismatch() -> IdempotencyKeyConflict:
+    return IdempotencyKeyConflict(
+        "Idempotency-Key sudah dipakai untuk request yang berbeda",
+        status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+    )
+
+
+idempotency_store: IdempotencyStore = InMemoryIdempotencyStore(
+    ttl_seconds=settings.idempotency_ttl_seconds,
+    max_entries=settings.idempotency_max_entries,
+    wait_timeout=settings.idempotency_wait_timeout_seconds,
+)
+
+
+async def _request_scope(request: Request) -> tuple[str, str]:
+    """Hitung scope key (per method, path, dan credential) dan fingerprint body"""
+    key = request.headers[IDEMPOTENCY_HEADER]
+    authorization = request.headers.get("Authorization", "")
+    scope = hashlib.sha256(
+        f"{request.method}\n{request.url.path}\n{authorization}".encode()
+    ).hexdigest()
+    fingerprint = hashlib.sha256(await request.body()).hexdigest()
+    return f"{scope}:{key}", fingerprint
+
+
+def idempotency_exempt(endpoint: Callable) -> Callable:
+    """
+    Tandai endpoint agar tidak diproses IdempotentRoute
+
+    Dipakai untuk endpoint yang response-nya memuat credential (mis. access
+    token login): response seperti itu tidak boleh disimpan di memori dan
+    diputar ulang setelah kedaluwarsa. Pasang di bawah decorator router.
+    """
+    endpoint.idempotency_exempt = True
+    return endpoint
+
+
+def _replay(stored: StoredResponse) -> Response:
+    response = Response(status_code=stored.status_code)
+    response.raw_headers = list(stored.headers) + [
+        (IDEMPOTENCY_REPLAYED_HEADER.lower().encode(), b"true")
+    ]
+    response.body = stored.body
+    return response
+
+
+class IdempotentRoute(APIRoute):
+    """
+    Route class yang mendukung header Idempotency-Key untuk method POST
+
+    Pakai lewat `APIRouter(route_class=IdempotentRoute)`. Response pertama
+    yang sukses (2xx) atau error client yang deterministik
+    (STORED_CLIENT_ERRORS) disimpan dan diputar ulang byte-for-byte untuk request
+    berikutnya dengan key dan body yang sama. Request tanpa header dan
+    endpoint yang ditandai idempotency_exempt diproses seperti biasa.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        route_handler = super().get_route_handler()
+        if "POST" not in self.methods or getattr(self.endpoint, "idempotency_exempt", False):
+            return route_handler
+
+        async def idempotent_route_handler(request: Request) -> Response:
+            key = request.headers.get(IDEMPOTENCY_HEADER)
+            if key is None:
+                return await route_handler(request)
+            if not key or len(key) > MAX_KEY_LENGTH:
+                raise HTTPException(
+                    status_code=HTTPStatus.BAD_REQUEST,
+                    detail=f"{IDEMPOTENCY_HEADER} harus 1-{MAX_KEY_LENGTH} karakter"
+                )
+
+            store_key, fingerprint = await _request_scope(request)
+            try:
+                stored = await idempotency_store.reserve(store_key, fingerprint)
+            except IdempotencyKeyConflict as e:
+                raise HTTPException(status_code=e.status_code, detail=str(e))
+            if stored is not None:
+                return _replay(stored)
+
+            try:
+                try:
+                    response = await route_handler(request)
+                except HTTPException as e:
+                    response = await http_exception_handler(request, e)
+            except BaseException:
+                await idempotency_store.release(store_key)
+                raise
+
+            body = getattr(response, "body", None)
+            storable = (
+                200 <= response.status_code < 300
+                or response.status_code in STORED_CLIENT_ERRORS
+            )
+            if body is None or response.background is not None or not storable:
+                await idempotency_store.release(store_key)
+                return response
+
+            await idempotency_store.complete(
+                store_key,
+                StoredResponse(
+                    status_code=response.status_code,
+                    headers=list(response.raw_headers),
+                    body=bytes(body),
+                ),
+            )
+            return response
+
+        return idempotent_route_handler
@@ -0,0 +1,166 @@
+"""
+Adaptive concurrency limiter dan priority load shedding
+ASGI middleware yang membatasi request in-flight berdasarkan latency
+"""
+import time
+from enum import IntEnum
+from http import HTTPStatus
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class Priority(IntEnum):
+    """Kelas prioritas request, makin tinggi makin didahulukan"""
+    LOW = 0
+    NORMAL = 1
+    CRITICAL = 2
+
+
+# Request CRITICAL tidak pernah di-shed dan tidak dihitung oleh limiter
+CRITICAL_PATHS = ("/health",)
+
+# Koneksi streaming berumur panjang: setup-nya (auth, query user) dihitung
+# limiter, tapi slot dilepas begitu response dimulai karena durasi stream
+# tidak mencerminkan beban
+STREAMING_PATHS = ("/api/events/stream",)
+
+# Endpoint mahal (bcrypt) yang di-shed lebih dulu saat beban tinggi
+LOW_PRIORITY_PATHS = ("/api/auth/login", "/api/auth/register")
+
+# Porsi dari limit yang boleh dipakai tiap prioritas
+PRIORITY_SHARES = {
+    Priority.LOW: 0.75,
+    Priority.NORMAL: 1.0,
+}
+
+
+def classify_request(scope: Scope) -> Priority:
+    """Tentukan prioritas request dari path dan method"""
+    path = scope["path"].rstrip("/") or "/"
+    if path in CRITICAL_PATHS or scope["method"] == "OPTIONS":
+        return Priority.CRITICAL
+    if path in LOW_PRIORITY_PATHS:
+        return Priority.LOW
+    return Priority.NORMAL
+
+
+class AIMDLimiter:
+    """
+    Concurrency limit dengan Additive Increase / Multiplicative Decrease
+
+    Setiap request yang selesai di bawah target_latency menaikkan limit
+    sebesar 1/limit (kira-kira +1 per putaran penuh) selama limit sedang
+    terpakai. Request yang melebihi target_latency atau gagal (5xx)
+    mengalikan limit dengan backoff_ratio, paling sering sekali per
+    target_latency agar satu gelombang request lambat tidak langsung
+    menjatuhkan limit ke minimum.
+    """
+
+    def __init__(
+        self,
+        initial_limit: float,
+        min_limit: float,
+        max_limit: float,
+        target_latency: float,
+        backoff_ratio: float = 0.9,
+    ):
+        self.limit = float(initial_limit)
+        self.min_limit = float(min_limit)
+        self.max_limit = float(max_limit)
+        self.target_latency = target_latency
+        self.backoff_ratio = backoff_ratio
+        self.in_flight = 0
+        self._last_decrease = 0.0
+
+    def try_acquire(self, priority: Priority) -> bool:
+        """Ambil slot untuk request; False jika request harus di-shed"""
+        if self.in_flight >= self.limit * PRIORITY_SHARES[priority]:
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self, latency: float, failed: bool) -> None:
+        """Kembalikan slot dan sesuaikan limit dari latency yang teramati"""
+        self.in_flight -= 1
+        now = time.monotonic()
+
+        if failed or latency > self.target_latency:
+            if now - self._last_decrease >= self.target_latency:
+                self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+                self._last_decrease = now
+        elif self.in_flight * 2 >= self.limit:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+
+class LoadSheddingMiddleware:
+    """
+    ASGI middleware yang menolak request dengan 503 saat limit tercapai
+
+    Request yang di-shed langsung dijawab dengan header Retry-After,
+    tidak diantrekan. Limiter berlaku per proses worker.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        initial_limit: float = 20,
+        min_limit: float = 2,
+        max_limit: float = 200,
+        target_latency: float = 1.0,
+        retry_after_seconds: int = 1,
+    ):
+        self.app = app
+        self.limiter = AIMDLimiter(
+            initial_limit=initial_limit,
+            min_limit=min_limit,
+            max_limit=max_limit,
+            target_latency=target_latency,
+        )
+        self.retry_after_seconds = retry_after_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        priority = classify_request(scope)
+        if priority == Priority.CRITICAL:
+            await self.app(scope, receive, send)
+            return
+
+        if not self.limiter.try_acquire(priority):
+            response = JSONResponse(
+                {"detail": "Server sedang sibuk, silakan coba lagi"},
+                status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+                headers={"Retry-After": str(self.retry_after_seconds)},
+            )
+            await response(scope, receive, send)
+            return
+
+        status_code = HTTPStatus.INTERNAL_SERVER_ERROR
+        streaming = (scope["path"].rstrip("/") or "/") in STREAMING_PATHS
+        released = False
+        start = time.monotonic()
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                self.limiter.release(
+                    latency=time.monotonic() - start,
+                    failed=status_code >= HTTPStatus.INTERNAL_SERVER_ERROR,
+                )
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if streaming:
+                    release()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            release()
@@ -2,12 +2,17 @@
 Security utilities untuk password hashing dan JWT tokens
 Berisi fungsi untuk hash password dan generate JWT token
 """
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
+import json
 import uuid
 
 from passlib.context import CryptContext
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
 
 from app_backend.conf.settings import settings
 
@@ -25,6 +30,70 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+@dataclass(frozen=True)
+class JWTKeyRing:
+    """Kumpulan key JWT asimetris yang sudah di-parse"""
+    algorithm: str
+    active_kid: str
+    signing_key: Key
+    verification_keys: dict[str, Key]
+    jwks_body: bytes
+
+
+def _read_key(path: str, algorithm: str) -> Key:
+    return jwk.construct(Path(path).read_text(), algorithm)
+
+
+@lru_cache(maxsize=1)
+def get_key_ring() -> Optional[JWTKeyRing]:
+    """
+    Load dan cache key JWT asimetris dari settings
+    
+    Mengembalikan None jika tidak ada private key yang dikonfigurasi
+    (token ditandatangani dengan secret_key).
+    
+    Raises:
+        ValueError: Jika jwt_active_kid tidak menunjuk ke private key
+    """
+    if not settings.jwt_private_key_files:
+        return None
+    
+    algorithm = settings.jwt_asymmetric_algorithm
+    private_keys = {
+        kid: _read_key(path, algorithm)
+        for kid, path in settings.jwt_private_key_files.items()
+    }
+    
+    active_kid = settings.jwt_active_kid
+    if active_kid is None and len(private_keys) == 1:
+        active_kid = next(iter(private_keys))
+    if active_kid not in private_keys:
+        raise ValueError("jwt_active_kid harus menunjuk ke salah satu jwt_private_key_files")
+    
+    # Private key aktif dan yang belum aktif dipublikasikan bersama public key
+    # lama, supaya service lain bisa memverifikasi token selama rotasi
+    verification_keys = {
+        kid: _read_key(path, algorithm)
+        for kid, path in settings.jwt_public_key_files.items()
+    }
+    verification_keys.update({kid: key.public_key() for kid, key in private_keys.items()})
+    
+    jwks = {
+        "keys": [
+            {**key.to_dict(), "kid": kid, "use": "sig", "alg": algorithm}
+            for kid, key in verification_keys.items()
+        ]
+    }
+    
+    return JWTKeyRing(
+        algorithm=algorithm,
+        active_kid=active_kid,
+        signing_key=private_keys[active_kid],
+        verification_keys=verification_keys,
+        jwks_body=json.dumps(jwks, separators=(",", ":")).encode(),
+    )
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Buat JWT access token"""
     to_encode = data.copy()
@@ -40,14 +109,35 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     if "user_id" in to_encode and isinstance(to_encode["user_id"], uuid.UUID):
         to_encode["user_id"] = str(to_encode["user_id"])
     
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    key_ring = get_key_ring()
+    if key_ring is None:
+        return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    
+    encoded_jwt = jwt.encode(
+        to_encode,
+        key_ring.signing_key,
+        algorithm=key_ring.algorithm,
+        headers={"kid": key_ring.active_kid}
+    )
     return encoded_jwt
 
 
 def decode_access_token(token: str) -> Optional[dict]:
     """Decode dan verify JWT token"""
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        key_ring = get_key_ring()
+        if key_ring is None:
+            return jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        
+        # Pilih public key berdasarkan kid di header token
+        kid = jwt.get_unverified_header(token).get("kid")
+        if not isinstance(kid, str):
+            return None
+        key = key_ring.verification_keys.get(kid)
+        if key is None:
+            return None
+        
+        payload = jwt.decode(token, key, algorithms=[key_ring.algorithm])
         return payload
     except JWTError:
         return None
@@ -0,0 +1,145 @@
+"""
+Tests untuk audit log autentikasi di shared/audit.py
+"""
+import logging
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app_backend.routers.api import audit as audit_router
+from app_backend.shared.audit import (
+    AuditEvent,
+    AuditEventType,
+    AuthAuditLog,
+    _next_month,
+    _partition_name,
+    drop_expired_partitions,
+)
+from app_backend.shared.database import get_read_session, get_session
+from app_backend.shared.dependencies import get_current_active_user
+
+
+def _audit_log(session_factory=None, **kwargs) -> AuthAuditLog:
+    options = dict(
+        capacity=10,
+        batch_size=10,
+        flush_interval=60,
+        retention_days=90,
+        maintenance_interval=3600,
+    )
+    options.update(kwargs)
+    return AuthAuditLog(session_factory=session_factory, **options)
+
+
+def _event(n: int = 0) -> AuditEvent:
+    return AuditEvent(event_type=AuditEventType.LOGIN_SUCCESS, detail=str(n))
+
+
+def test_full_buffer_overwrites_oldest_and_counts_drops():
+    audit_log = _audit_log(capacity=3)
+    for n in range(5):
+        audit_log.record(_event(n))
+
+    assert audit_log.dropped == 2
+    assert [e.detail for e in audit_log._take_batch()] == ["2", "3", "4"]
+    assert audit_log.stats() == {"buffered": 0, "dropped": 2, "failed": 0}
+
+
+def test_flusher_is_woken_when_batch_size_is_reached():
+    audit_log = _audit_log(batch_size=2)
+
+    audit_log.record(_event())
+    assert not audit_log._wake.is_set()
+
+    audit_log.record(_event())
+    assert audit_log._wake.is_set()
+
+
+def test_failed_flush_is_counted_and_logged(caplog):
+    def broken_session():
+        raise RuntimeError("database tidak tersedia")
+
+    audit_log = _audit_log(session_factory=broken_session, batch_size=2)
+    for n in range(3):
+        audit_log.record(_event(n))
+
+    with caplog.at_level(logging.ERROR, logger="app_backend.shared.audit"):
+        assert audit_log.flush() == 0
+
+    assert audit_log.failed == 3
+    assert audit_log.stats()["buffered"] == 0
+    assert "event audit" in caplog.text
+
+
+@pytest.mark.parametrize("month, expected", [
+    (date(2024, 1, 1), date(2024, 2, 1)),
+    (date(2024, 2, 1), date(2024, 3, 1)),
+    (date(2024, 12, 1), date(2025, 1, 1)),
+])
+def test_next_month(month, expected):
+    assert _next_month(month) == expected
+
+
+def test_partition_name():
+    assert _partition_name(date(2024, 3, 1)) == "auth_audit_log_202403"
+
+
+class _FakeResult:
+    def __init__(self, names):
+        self.names = names
+
+    def scalars(self):
+        return iter(self.names)
+
+
+class _FakeSession:
+    def __init__(self, partitions):
+        self.partitions = partitions
+        self.statements = []
+
+    def execute(self, statement, params=None):
+        self.statements.append(str(statement))
+        return _FakeResult(self.partitions)
+
+
+def test_drop_expired_partitions_keeps_months_overlapping_retention():
+    session = _FakeSession([
+        "auth_audit_log_202401",
+        "auth_audit_log_202402",
+        "auth_audit_log_202403",
+        "auth_audit_log_default",
+    ])
+
+    # Cutoff 2024-03-01: Februari berakhir tepat di cutoff, Maret masih dalam retensi
+    dropped = drop_expired_partitions(session, retention_days=30, today=date(2024, 3, 31))
+
+    assert dropped == ["auth_audit_log_202401", "auth_audit_log_202402"]
+    assert session.statements[1:] == [
+        'DROP TABLE IF EXISTS "auth_audit_log_202401"',
+        'DROP TABLE IF EXISTS "auth_audit_log_202402"',
+    ]
+
+
+def test_aware_datetimes_are_converted_to_naive_utc():
+    aware = datetime(2024, 3, 1, 7, 0, tzinfo=timezone(timedelta(hours=7)))
+
+    assert audit_router._to_naive_utc(aware) == datetime(2024, 3, 1, 0, 0)
+    assert audit_router._to_naive_utc(datetime(2024, 3, 1)) == datetime(2024, 3, 1)
+
+
+def test_empty_range_is_rejected():
+    app = FastAPI()
+    app.include_router(audit_router.router)
+    app.dependency_overrides[get_current_active_user] = lambda: type("User", (), {"id": uuid.uuid4()})()
+    app.dependency_overrides[get_read_session] = lambda: None
+    app.dependency_overrides[get_session] = lambda: None
+
+    response = TestClient(app).get(
+        "/api/audit/me",
+        params={"start": "2024-03-02T00:00:00", "end": "2024-03-01T00:00:00"},
+    )
+
+    assert response.status_code == 422
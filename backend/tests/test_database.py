@@ -0,0 +1,173 @@
+"""
+Tests untuk routing read replica di shared/database.py
+Dua database SQLite terpisah dipakai sebagai stand-in primary dan replica
+"""
+import threading
+import time
+import uuid
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+
+from app_backend.models.user import UserModel
+from app_backend.shared import database
+from app_backend.shared.database import ReplicaRouter, get_read_session, get_session, read_first
+from app_backend.shared.dependencies import get_current_user
+from app_backend.shared.security import create_access_token
+
+
+def _add_user(engine, user_id: uuid.UUID) -> None:
+    with sessionmaker(bind=engine).begin() as session:
+        session.add(UserModel(
+            id=user_id,
+            email=f"{user_id.hex[:8]}@example.com",
+            username=f"user_{user_id.hex[:8]}",
+            full_name="Test User",
+            hashed_password="hashed",
+        ))
+
+
+def _open(dependency):
+    generator = dependency()
+    return generator, next(generator)
+
+
+@pytest.fixture
+def primary(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    UserModel.__table__.create(engine)
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(bind=engine))
+    return engine
+
+
+@pytest.fixture
+def replica(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    UserModel.__table__.create(engine)
+    return engine
+
+
+@pytest.fixture
+def router(monkeypatch, replica):
+    router = ReplicaRouter([replica], max_lag_seconds=5, health_check_interval=60)
+    monkeypatch.setattr(router, "_check", lambda engine: True)
+    monkeypatch.setattr(database, "replica_router", router)
+    return router
+
+
+def test_read_session_routes_to_healthy_replica(primary, replica, router):
+    user_id = uuid.uuid4()
+    _add_user(replica, user_id)
+
+    read_gen, read_session = _open(get_read_session)
+    primary_gen, primary_session = _open(get_session)
+
+    query = select(UserModel.id).where(UserModel.id == user_id)
+    assert read_session.execute(query).scalar() == user_id
+    assert primary_session.execute(query).scalar() is None
+
+    read_gen.close()
+    primary_gen.close()
+
+
+def test_read_session_uses_primary_when_no_replica_is_healthy(primary, replica, router, monkeypatch):
+    monkeypatch.setattr(router, "_check", lambda engine: False)
+
+    read_gen, read_session = _open(get_read_session)
+    assert read_session.get_bind() is primary
+    read_gen.close()
+
+
+def test_get_current_user_falls_back_to_primary_when_missing_on_replica(primary, router):
+    user_id = uuid.uuid4()
+    _add_user(primary, user_id)
+
+    read_gen, read_session = _open(get_read_session)
+    primary_gen, primary_session = _open(get_session)
+    token = create_access_token({"user_id": user_id})
+
+    user = get_current_user(
+        credentials=HTTPAuthorizationCredentials(scheme="Bearer", credentials=token),
+        session=read_session,
+        primary_session=primary_session,
+    )
+
+    assert user.id == user_id
+    read_gen.close()
+    primary_gen.close()
+
+
+def test_get_current_user_falls_back_when_replica_query_fails(primary, replica, router):
+    user_id = uuid.uuid4()
+    _add_user(primary, user_id)
+    # Replica lolos health check tapi tabel users tidak ada
+    UserModel.__table__.drop(replica)
+
+    read_gen, read_session = _open(get_read_session)
+    primary_gen, primary_session = _open(get_session)
+    token = create_access_token({"user_id": user_id})
+
+    user = get_current_user(
+        credentials=HTTPAuthorizationCredentials(scheme="Bearer", credentials=token),
+        session=read_session,
+        primary_session=primary_session,
+    )
+
+    assert user.id == user_id
+    assert router.pick() is None
+    read_gen.close()
+    primary_gen.close()
+
+
+def test_health_check_is_not_repeated_by_concurrent_requests(replica):
+    router = ReplicaRouter([replica], max_lag_seconds=5, health_check_interval=60)
+    calls = []
+
+    def slow_check(engine):
+        calls.append(engine)
+        time.sleep(0.2)
+        return True
+
+    router._check = slow_check
+    threads = [threading.Thread(target=router.pick) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert router.pick() is replica
+
+
+def test_read_first_does_not_requery_primary_when_read_ran_on_primary(primary, monkeypatch):
+    monkeypatch.setattr(database, "replica_router", ReplicaRouter([], max_lag_seconds=5, health_check_interval=60))
+    statements = []
+    event.listen(primary, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    read_gen, read_session = _open(get_read_session)
+    primary_gen, primary_session = _open(get_session)
+
+    query = select(UserModel.id).where(UserModel.id == uuid.uuid4())
+    assert read_first(query, read_session, primary_session) is None
+    assert len(statements) == 1
+
+    read_gen.close()
+    primary_gen.close()
+
+
+def test_read_first_does_not_requery_after_fallback(primary, replica, router):
+    UserModel.__table__.drop(replica)
+    statements = []
+    event.listen(primary, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    read_gen, read_session = _open(get_read_session)
+    primary_gen, primary_session = _open(get_session)
+
+    query = select(UserModel.id).where(UserModel.id == uuid.uuid4())
+    assert read_first(query, read_session, primary_session) is None
+    assert len(statements) == 1
+
+    read_gen.close()
+    primary_gen.close()
@@ -0,0 +1,129 @@
+"""
+Tests untuk broker pub/sub di shared/events.py dan stream SSE
+"""
+import asyncio
+import time
+import uuid
+
+import pytest
+
+from app_backend.routers.api import events as events_router
+from app_backend.shared.events import RESET_EVENT_TYPE, EventBroker
+
+
+def _broker(**kwargs) -> EventBroker:
+    options = dict(buffer_size=10, history_size=10, max_topics=10)
+    options.update(kwargs)
+    return EventBroker(**options)
+
+
+async def _drain(subscription) -> list:
+    """Ambil semua event yang sudah ada di buffer subscription"""
+    await asyncio.sleep(0)
+    items = []
+    while not subscription.queue.empty():
+        items.append(subscription.queue.get_nowait())
+    return items
+
+
+@pytest.mark.asyncio
+async def test_subscriber_receives_published_events():
+    broker = _broker()
+    subscription = broker.subscribe("user")
+
+    event = broker.publish("user", "changed", {"n": 1})
+    broker.publish("other", "changed", {"n": 2})
+
+    assert await _drain(subscription) == [event]
+
+
+@pytest.mark.asyncio
+async def test_resume_replays_events_after_last_event_id():
+    broker = _broker()
+    first = broker.publish("user", "changed", {"n": 1})
+    missed = [broker.publish("user", "changed", {"n": n}) for n in (2, 3)]
+
+    subscription = broker.subscribe("user", last_event_id=first.id)
+
+    assert await _drain(subscription) == missed
+
+
+@pytest.mark.asyncio
+async def test_resume_sends_reset_when_history_is_truncated():
+    broker = _broker(history_size=2)
+    first = broker.publish("user", "changed", {"n": 1})
+    for n in (2, 3, 4):
+        broker.publish("user", "changed", {"n": n})
+
+    subscription = broker.subscribe("user", last_event_id=first.id)
+
+    [reset] = await _drain(subscription)
+    assert reset.type == RESET_EVENT_TYPE
+
+
+@pytest.mark.asyncio
+async def test_resume_sends_reset_after_topic_is_evicted():
+    broker = _broker(max_topics=1)
+    event = broker.publish("user", "changed", {"n": 1})
+    broker.publish("user", "changed", {"n": 2})
+    broker.publish("other", "changed", {"n": 3})
+
+    subscription = broker.subscribe("user", last_event_id=event.id)
+
+    [reset] = await _drain(subscription)
+    assert reset.type == RESET_EVENT_TYPE
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_is_closed_on_overflow():
+    broker = _broker(buffer_size=2)
+    subscription = broker.subscribe("user")
+    for n in range(3):
+        broker.publish("user", "changed", {"n": n})
+    await asyncio.sleep(0)
+
+    received = [event async for event in subscription.events(heartbeat_seconds=1)]
+
+    assert received == []
+    assert subscription.overflowed
+
+
+@pytest.mark.asyncio
+async def test_events_stop_at_deadline_with_heartbeats():
+    subscription = _broker().subscribe("user")
+
+    received = [
+        event async for event in subscription.events(heartbeat_seconds=0.02, until=time.time() + 0.1)
+    ]
+
+    assert received and all(event is None for event in received)
+
+
+@pytest.mark.asyncio
+async def test_stream_ends_with_auth_expired_when_token_expires(monkeypatch):
+    broker = _broker()
+    monkeypatch.setattr(events_router, "event_broker", broker)
+    subscription = broker.subscribe("user")
+
+    chunks = [
+        chunk async for chunk in events_router._event_stream(subscription, uuid.uuid4(), time.time() + 0.05)
+    ]
+
+    assert chunks[-1] == events_router.AUTH_EXPIRED
+    assert "user" not in broker._subscribers
+
+
+@pytest.mark.asyncio
+async def test_stream_ends_when_user_is_deactivated(monkeypatch):
+    broker = _broker()
+    monkeypatch.setattr(events_router, "event_broker", broker)
+    monkeypatch.setattr(events_router.settings, "events_user_recheck_seconds", 0.05)
+    monkeypatch.setattr(events_router, "_user_is_active", lambda user_id: False)
+    subscription = broker.subscribe("user")
+
+    chunks = [
+        chunk async for chunk in events_router._event_stream(subscription, uuid.uuid4(), time.time() + 60)
+    ]
+
+    assert events_router.AUTH_EXPIRED not in chunks
+    assert "user" not in broker._subscribers
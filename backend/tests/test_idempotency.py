@@ -0,0 +1,170 @@
+"""
+Tests untuk Idempotency-Key di shared/idempotency.py
+"""
+import asyncio
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from app_backend.shared.idempotency import (
+    IDEMPOTENCY_HEADER,
+    IdempotencyKeyConflict,
+    IdempotentRoute,
+    InMemoryIdempotencyStore,
+    StoredResponse,
+    idempotency_exempt,
+)
+
+RESPONSE = StoredResponse(status_code=201, headers=[(b"content-type", b"application/json")], body=b'{"ok":true}')
+
+
+def _store(**kwargs) -> InMemoryIdempotencyStore:
+    options = dict(ttl_seconds=60, max_entries=10, wait_timeout=1.0)
+    options.update(kwargs)
+    return InMemoryIdempotencyStore(**options)
+
+
+@pytest.mark.asyncio
+async def test_completed_key_replays_stored_response():
+    store = _store()
+    assert await store.reserve("k", "fp") is None
+    await store.complete("k", RESPONSE)
+
+    assert await store.reserve("k", "fp") == RESPONSE
+
+
+@pytest.mark.asyncio
+async def test_key_reused_with_different_body_is_rejected():
+    store = _store()
+    await store.reserve("k", "fp")
+    await store.complete("k", RESPONSE)
+
+    with pytest.raises(IdempotencyKeyConflict) as exc_info:
+        await store.reserve("k", "other")
+    assert exc_info.value.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_waiters_receive_response_of_in_flight_request():
+    store = _store()
+    assert await store.reserve("k", "fp") is None
+
+    waiters = [asyncio.create_task(store.reserve("k", "fp")) for _ in range(3)]
+    await asyncio.sleep(0)
+    await store.complete("k", RESPONSE)
+
+    assert await asyncio.gather(*waiters) == [RESPONSE] * 3
+
+
+@pytest.mark.asyncio
+async def test_waiter_reclaims_key_after_release():
+    store = _store()
+    assert await store.reserve("k", "fp") is None
+
+    waiter = asyncio.create_task(store.reserve("k", "fp"))
+    await asyncio.sleep(0)
+    await store.release("k")
+
+    # Request pertama gagal, waiter mendapat klaim untuk memproses ulang
+    assert await waiter is None
+    await store.complete("k", RESPONSE)
+    assert await store.reserve("k", "fp") == RESPONSE
+
+
+@pytest.mark.asyncio
+async def test_waiter_times_out_while_key_in_flight():
+    store = _store(wait_timeout=0.01)
+    await store.reserve("k", "fp")
+
+    with pytest.raises(IdempotencyKeyConflict) as exc_info:
+        await store.reserve("k", "fp")
+    assert exc_info.value.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_store_is_bounded_and_entries_expire():
+    store = _store(max_entries=2)
+    for key in ("a", "b", "c"):
+        await store.reserve(key, "fp")
+        await store.complete(key, RESPONSE)
+
+    # "a" dibuang karena LRU penuh, jadi bisa diklaim lagi
+    assert await store.reserve("a", "fp") is None
+
+    expiring = _store(ttl_seconds=0)
+    await expiring.reserve("k", "fp")
+    await expiring.complete("k", RESPONSE)
+    assert await expiring.reserve("k", "fp") is None
+
+
+def test_route_replays_response_and_skips_exempt_endpoints(monkeypatch):
+    from app_backend.shared import idempotency
+
+    monkeypatch.setattr(idempotency, "idempotency_store", _store())
+    calls = {"create": 0, "login": 0}
+    router = APIRouter(route_class=IdempotentRoute)
+
+    @router.post("/create")
+    def create():
+        calls["create"] += 1
+        return {"n": calls["create"]}
+
+    @router.post("/login")
+    @idempotency_exempt
+    def login():
+        calls["login"] += 1
+        return {"n": calls["login"]}
+
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+    headers = {IDEMPOTENCY_HEADER: "key-1"}
+
+    first = client.post("/create", headers=headers)
+    second = client.post("/create", headers=headers)
+    assert second.content == first.content
+    assert second.headers["idempotent-replayed"] == "true"
+    assert calls["create"] == 1
+
+    client.post("/login", headers=headers)
+    replay = client.post("/login", headers=headers)
+    assert "idempotent-replayed" not in replay.headers
+    assert calls["login"] == 2
+
+
+def test_route_stores_deterministic_errors_only(monkeypatch):
+    from fastapi import HTTPException
+
+    from app_backend.shared import idempotency
+
+    monkeypatch.setattr(idempotency, "idempotency_store", _store())
+    calls = {"conflict": 0, "unavailable": 0}
+    router = APIRouter(route_class=IdempotentRoute)
+
+    @router.post("/conflict")
+    def conflict():
+        calls["conflict"] += 1
+        raise HTTPException(status_code=409, detail="sudah ada")
+
+    @router.post("/unavailable")
+    def unavailable():
+        calls["unavailable"] += 1
+        raise HTTPException(status_code=503, detail="coba lagi")
+
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+    headers = {IDEMPOTENCY_HEADER: "key-1"}
+
+    client.post("/conflict", headers=headers)
+    replay = client.post("/conflict", headers=headers)
+    assert replay.status_code == 409
+    assert replay.headers["idempotent-replayed"] == "true"
+    assert calls["conflict"] == 1
+
+    client.post("/unavailable", headers=headers)
+    retry = client.post("/unavailable", headers=headers)
+    assert retry.status_code == 503
+    assert "idempotent-replayed" not in retry.headers
+    assert calls["unavailable"] == 2
@@ -0,0 +1,134 @@
+"""
+Tests untuk adaptive concurrency limiter di shared/load_shedding.py
+"""
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app_backend.shared.load_shedding import AIMDLimiter, LoadSheddingMiddleware, Priority
+
+
+def _limiter(**kwargs) -> AIMDLimiter:
+    options = dict(initial_limit=4, min_limit=2, max_limit=10, target_latency=1.0)
+    options.update(kwargs)
+    return AIMDLimiter(**options)
+
+
+def test_low_priority_only_gets_share_of_limit():
+    limiter = _limiter()
+
+    assert [limiter.try_acquire(Priority.LOW) for _ in range(4)] == [True, True, True, False]
+    assert limiter.try_acquire(Priority.NORMAL)
+    assert not limiter.try_acquire(Priority.NORMAL)
+
+
+def test_slow_or_failed_request_decreases_limit_once_per_window():
+    limiter = _limiter(initial_limit=10)
+    for _ in range(3):
+        limiter.try_acquire(Priority.NORMAL)
+
+    limiter.release(latency=2.0, failed=False)
+    assert limiter.limit == pytest.approx(9.0)
+
+    # Masih dalam window yang sama, tidak turun lagi
+    limiter.release(latency=0.1, failed=True)
+    assert limiter.limit == pytest.approx(9.0)
+
+    limiter._last_decrease -= limiter.target_latency
+    limiter.release(latency=0.1, failed=True)
+    assert limiter.limit == pytest.approx(8.1)
+    assert limiter.in_flight == 0
+
+
+def test_limit_never_drops_below_minimum():
+    limiter = _limiter(initial_limit=2)
+    limiter.try_acquire(Priority.NORMAL)
+    limiter.release(latency=5.0, failed=False)
+
+    assert limiter.limit == 2
+
+
+def test_fast_requests_increase_limit_only_when_utilized():
+    limiter = _limiter(initial_limit=4)
+
+    # Hanya 1 dari 4 slot terpakai: limit tidak naik
+    limiter.try_acquire(Priority.NORMAL)
+    limiter.release(latency=0.1, failed=False)
+    assert limiter.limit == 4
+
+    for _ in range(3):
+        limiter.try_acquire(Priority.NORMAL)
+    limiter.release(latency=0.1, failed=False)
+    assert limiter.limit == pytest.approx(4.25)
+
+
+def test_limit_never_exceeds_maximum():
+    limiter = _limiter(initial_limit=10, max_limit=10)
+    for _ in range(10):
+        limiter.try_acquire(Priority.NORMAL)
+    limiter.release(latency=0.1, failed=False)
+
+    assert limiter.limit == 10
+
+
+@pytest.mark.asyncio
+async def test_middleware_sheds_with_retry_after_and_admits_health():
+    app = FastAPI()
+    release = asyncio.Event()
+
+    @app.post("/api/auth/login")
+    async def login():
+        await release.wait()
+        return {}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    app.add_middleware(LoadSheddingMiddleware, initial_limit=1, min_limit=1, retry_after_seconds=3)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        # Limit 1 * 0.75: satu login menempati semua slot LOW
+        pending = asyncio.create_task(client.post("/api/auth/login"))
+        await asyncio.sleep(0.05)
+
+        shed = await asyncio.wait_for(client.post("/api/auth/login"), timeout=5)
+        health = await client.get("/health")
+        release.set()
+        admitted = await pending
+
+    assert shed.status_code == 503
+    assert shed.headers["retry-after"] == "3"
+    assert health.status_code == 200
+    assert admitted.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_streaming_request_releases_slot_when_response_starts():
+    started = asyncio.Event()
+    finish = asyncio.Event()
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        started.set()
+        await finish.wait()
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    middleware = LoadSheddingMiddleware(app, initial_limit=1, min_limit=1)
+    scope = {"type": "http", "path": "/api/events/stream", "method": "GET"}
+    stream = asyncio.create_task(middleware(scope, receive, send))
+    await asyncio.wait_for(started.wait(), timeout=5)
+
+    # Stream masih terbuka tapi slot sudah kembali ke limiter
+    assert middleware.limiter.in_flight == 0
+    finish.set()
+    await stream
+    assert middleware.limiter.in_flight == 0
@@ -0,0 +1,124 @@
+"""
+Tests untuk signing JWT asimetris dan JWKS di shared/security.py
+"""
+import base64
+import json
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from jose import jwt
+
+from app_backend.conf.settings import settings
+from app_backend.routers import well_known
+from app_backend.shared.security import create_access_token, decode_access_token, get_key_ring
+
+
+def _write_key_pair(directory, kid: str) -> tuple[str, str]:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_path = directory / f"{kid}.pem"
+    public_path = directory / f"{kid}.pub.pem"
+    private_path.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ))
+    public_path.write_bytes(key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    ))
+    return str(private_path), str(public_path)
+
+
+def _configure(monkeypatch, private_keys: dict, public_keys: dict = None, active_kid: str = None):
+    monkeypatch.setattr(settings, "jwt_private_key_files", private_keys)
+    monkeypatch.setattr(settings, "jwt_public_key_files", public_keys or {})
+    monkeypatch.setattr(settings, "jwt_active_kid", active_kid)
+    get_key_ring.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_key_ring():
+    get_key_ring.cache_clear()
+    yield
+    get_key_ring.cache_clear()
+
+
+@pytest.fixture
+def keys(tmp_path):
+    return {kid: _write_key_pair(tmp_path, kid) for kid in ("2024", "2025")}
+
+
+def test_token_is_signed_with_active_kid_and_verified(monkeypatch, keys):
+    _configure(monkeypatch, {"2025": keys["2025"][0]})
+
+    token = create_access_token({"user_id": "abc"})
+
+    assert jwt.get_unverified_header(token)["kid"] == "2025"
+    assert jwt.get_unverified_header(token)["alg"] == "RS256"
+    assert decode_access_token(token)["user_id"] == "abc"
+
+
+def test_token_signed_with_retired_key_is_still_verified(monkeypatch, keys):
+    _configure(monkeypatch, {"2024": keys["2024"][0]})
+    old_token = create_access_token({"user_id": "abc"})
+
+    # Rotasi: key 2024 hanya tersisa sebagai public key untuk verifikasi
+    _configure(monkeypatch, {"2025": keys["2025"][0]}, {"2024": keys["2024"][1]})
+
+    assert decode_access_token(old_token)["user_id"] == "abc"
+    assert jwt.get_unverified_header(create_access_token({"user_id": "abc"}))["kid"] == "2025"
+
+
+def test_token_with_unknown_kid_is_rejected(monkeypatch, keys):
+    _configure(monkeypatch, {"2024": keys["2024"][0]})
+    token = create_access_token({"user_id": "abc"})
+
+    _configure(monkeypatch, {"2025": keys["2025"][0]})
+
+    assert decode_access_token(token) is None
+
+
+@pytest.mark.parametrize("kid", [123, None, ["2025"]])
+def test_token_with_non_string_kid_is_rejected(monkeypatch, keys, kid):
+    _configure(monkeypatch, {"2025": keys["2025"][0]})
+    token = create_access_token({"user_id": "abc"})
+    _, payload, signature = token.split(".")
+    header = base64.urlsafe_b64encode(
+        json.dumps({"alg": "RS256", "typ": "JWT", "kid": kid}).encode()
+    ).rstrip(b"=").decode()
+
+    assert decode_access_token(f"{header}.{payload}.{signature}") is None
+
+
+def test_active_kid_must_have_private_key(monkeypatch, keys):
+    _configure(monkeypatch, {"2025": keys["2025"][0]}, {"2024": keys["2024"][1]}, active_kid="2024")
+
+    with pytest.raises(ValueError):
+        get_key_ring()
+
+
+def test_jwks_publishes_all_verification_keys_with_cache_control(monkeypatch, keys):
+    _configure(monkeypatch, {"2025": keys["2025"][0]}, {"2024": keys["2024"][1]})
+    monkeypatch.setattr(settings, "jwks_cache_max_age_seconds", 600)
+    app = FastAPI()
+    app.include_router(well_known.router)
+
+    response = TestClient(app).get("/.well-known/jwks.json")
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=600"
+    published = {key["kid"]: key for key in response.json()["keys"]}
+    assert set(published) == {"2024", "2025"}
+    assert all(key["kty"] == "RSA" and key["use"] == "sig" for key in published.values())
+    assert all("d" not in key for key in published.values())
+
+
+def test_jwks_is_empty_with_symmetric_signing(monkeypatch):
+    _configure(monkeypatch, {})
+    app = FastAPI()
+    app.include_router(well_known.router)
+
+    assert TestClient(app).get("/.well-known/jwks.json").json() == {"keys": []}